@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import argparse
+import json
 import sys
 from pathlib import Path
 
@@ -11,28 +12,36 @@ DEFAULT_DATA_DIR = Path(__file__).resolve().parents[1] / "data"
 
 
 def _build_command(args: argparse.Namespace) -> list[str]:
-    command: list[str] = ["scrapy", "crawl", "tech_talk"]
-
-    def add_arg(flag: str, value: str) -> None:
-        command.extend([flag, value])
-
-    add_arg("-a", f"board={args.board}")
-    add_arg("-a", f"fetch_posts={'true' if args.fetch_posts else 'false'}")
-    if args.max_board_pages is not None:
-        add_arg("-a", f"max_board_pages={args.max_board_pages}")
-    if args.max_topics is not None:
-        add_arg("-a", f"max_topics={args.max_topics}")
-    if args.max_topic_pages is not None:
-        add_arg("-a", f"topic_max_pages={args.max_topic_pages}")
-    add_arg("-a", f"bootstrap={args.bootstrap}")
-    add_arg("-a", f"cf_mode={args.cf_mode}")
-
-    add_arg("--set", f"LOG_LEVEL={args.log_level}")
-    add_arg("--set", f"PLAYWRIGHT_STATE_TTL={args.state_ttl}")
     data_dir = Path(args.data_dir).resolve()
-    add_arg("--set", f"DATA_DIR={data_dir}")
-
-    return command
+    feeds = {
+        str(data_dir / "items.jsonl.gz"): {
+            "format": "jsonlines",
+            "encoding": "utf-8",
+            "overwrite": True,
+            "postprocessing": ["scrapy.extensions.postprocessing.GzipPlugin"],
+        }
+    }
+    return [
+        "scrapy", "crawl", "tech_talk",
+        "-a", f"board={args.board}",
+        "-a", f"fetch_posts={'true' if args.fetch_posts else 'false'}",
+        *(("-a", f"max_board_pages={args.max_board_pages}") if args.max_board_pages is not None else ()),
+        *(("-a", f"max_topics={args.max_topics}") if args.max_topics is not None else ()),
+        *(("-a", f"topic_max_pages={args.max_topic_pages}") if args.max_topic_pages is not None else ()),
+        "-a", f"bootstrap={args.bootstrap}",
+        "-a", f"cf_mode={args.cf_mode}",
+        *(("-a", "deep_clean=true") if args.deep_clean else ()),
+        "--set", f"LOG_LEVEL={args.log_level}",
+        "--set", f"PLAYWRIGHT_STATE_TTL={args.state_ttl}",
+        "--set", f"DATA_DIR={data_dir}",
+        *(("--set", f"FEEDS={json.dumps(feeds)}") if args.feed else ()),
+        *(("--set", f"JOBDIR={data_dir / 'jobdir'}") if args.jobdir else ()),
+        *(
+            ("--set", "HTTPCACHE_ENABLED=True", "--set", f"HTTPCACHE_DIR={data_dir / 'httpcache'}")
+            if args.http_cache
+            else ()
+        ),
+    ]
 
 
 def run_from_args(argv: list[str] | None = None) -> None:
@@ -61,7 +70,7 @@ def run_from_args(argv: list[str] | None = None) -> None:
         "--bootstrap",
         choices=["auto", "skip"],
         default="auto",
-        help="Whether to bootstrap cookies with undetected_chromedriver (default: auto)",
+        help="Whether to bootstrap cookies with a headless Playwright browser (default: auto)",
     )
     parser.add_argument(
         "--cf-mode",
@@ -69,6 +78,11 @@ def run_from_args(argv: list[str] | None = None) -> None:
         default="auto",
         help="Cloudflare handling strategy (default: auto)",
     )
+    parser.add_argument(
+        "--deep-clean",
+        action="store_true",
+        help="Run trafilatura over each post to fill extracted_text (slower; default uses the plain post text)",
+    )
     parser.add_argument(
         "--state-ttl",
         type=int,
@@ -80,6 +94,21 @@ def run_from_args(argv: list[str] | None = None) -> None:
         default=str(DEFAULT_DATA_DIR),
         help=f"Directory where scraped data is written (default: {DEFAULT_DATA_DIR})",
     )
+    parser.add_argument(
+        "--feed",
+        action="store_true",
+        help="Also stream every scraped item to <data-dir>/items.jsonl.gz",
+    )
+    parser.add_argument(
+        "--jobdir",
+        action="store_true",
+        help="Persist the request queue and seen topics under <data-dir>/jobdir so later runs resume and skip fetched topics",
+    )
+    parser.add_argument(
+        "--http-cache",
+        action="store_true",
+        help="Replay responses from an on-disk HTTP cache under the data directory (for development re-runs)",
+    )
     parser.add_argument(
         "--log-level",
         default="INFO",
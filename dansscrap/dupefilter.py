@@ -0,0 +1,87 @@
+import logging
+import math
+from pathlib import Path
+from typing import Optional
+
+from scrapy.dupefilters import BaseDupeFilter
+from scrapy.utils.job import job_dir
+from scrapy.utils.request import RequestFingerprinter
+
+
+logger = logging.getLogger(__name__)
+
+
+class BloomDupeFilter(BaseDupeFilter):
+    """Request dupefilter backed by a fixed-size Bloom filter.
+
+    Memory stays constant (about 5 MB for the default two million requests at a
+    1e-4 false-positive rate) instead of growing with every fingerprint. When
+    JOBDIR is set the bit array is saved there so a resumed crawl keeps its
+    seen-set, mirroring ``RFPDupeFilter``'s ``requests.seen`` file.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        capacity: int = 2_000_000,
+        error_rate: float = 1e-4,
+        debug: bool = False,
+        *,
+        fingerprinter=None,
+    ) -> None:
+        self.fingerprinter = fingerprinter or RequestFingerprinter()
+        self.debug = debug
+        self.logdupes = True
+        self.size = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.path = Path(path) / "requests.bloom" if path else None
+        if self.path and self.path.exists():
+            stored = self.path.read_bytes()
+            if len(stored) == len(self.bits):
+                self.bits[:] = stored
+            else:
+                logger.warning("Ignoring %s: it was built for a different capacity.", self.path)
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        settings = crawler.settings
+        return cls(
+            job_dir(settings),
+            settings.getint("BLOOM_DUPEFILTER_CAPACITY", 2_000_000),
+            settings.getfloat("BLOOM_DUPEFILTER_ERROR_RATE", 1e-4),
+            settings.getbool("DUPEFILTER_DEBUG"),
+            fingerprinter=crawler.request_fingerprinter,
+        )
+
+    def request_seen(self, request) -> bool:
+        fp = self.fingerprinter.fingerprint(request)
+        # Double hashing: derive every probe from two halves of the SHA1 fingerprint.
+        h1 = int.from_bytes(fp[:8], "little")
+        h2 = int.from_bytes(fp[8:16], "little") | 1
+        seen = True
+        for i in range(self.hashes):
+            bit = (h1 + i * h2) % self.size
+            mask = 1 << (bit & 7)
+            if not self.bits[bit >> 3] & mask:
+                seen = False
+                self.bits[bit >> 3] |= mask
+        return seen
+
+    def close(self, reason: str) -> None:
+        if self.path:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_bytes(self.bits)
+
+    def log(self, request, spider) -> None:
+        if self.debug:
+            logger.debug("Filtered duplicate request: %(request)s", {"request": request}, extra={"spider": spider})
+        elif self.logdupes:
+            logger.debug(
+                "Filtered duplicate request: %(request)s - no more duplicates will be shown"
+                " (see DUPEFILTER_DEBUG to show all duplicates)",
+                {"request": request},
+                extra={"spider": spider},
+            )
+            self.logdupes = False
+        spider.crawler.stats.inc_value("dupefilter/filtered", spider=spider)
@@ -0,0 +1,50 @@
+import orjson
+from itemadapter import ItemAdapter, is_item
+from scrapy.exporters import BaseItemExporter
+
+
+_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def _default(obj):
+    if is_item(obj):
+        return ItemAdapter(obj).asdict()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class OrjsonLinesItemExporter(BaseItemExporter):
+    """JSON Lines exporter that writes orjson bytes straight to the feed file."""
+
+    def __init__(self, file, **kwargs):
+        super().__init__(dont_fail=True, **kwargs)
+        self.file = file
+
+    def _dumps(self, item, option: int = 0) -> bytes:
+        # Dataclass items serialise natively; only filtered exports need a dict.
+        if self.fields_to_export is not None:
+            item = dict(self.get_serialized_fields(item))
+        return orjson.dumps(item, default=_default, option=_OPTIONS | option)
+
+    def export_item(self, item):
+        self.file.write(self._dumps(item, orjson.OPT_APPEND_NEWLINE))
+
+
+class OrjsonItemExporter(OrjsonLinesItemExporter):
+    """JSON array exporter built on orjson, one item per line."""
+
+    def __init__(self, file, **kwargs):
+        super().__init__(file, **kwargs)
+        self.first_item = True
+
+    def start_exporting(self):
+        self.file.write(b"[\n")
+
+    def finish_exporting(self):
+        self.file.write(b"\n]")
+
+    def export_item(self, item):
+        if self.first_item:
+            self.first_item = False
+        else:
+            self.file.write(b",\n")
+        self.file.write(self._dumps(item))
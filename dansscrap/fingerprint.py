@@ -0,0 +1,32 @@
+import hashlib
+
+from scrapy.utils.request import fingerprint
+
+from .utils import canonical_forum_url
+
+
+class ForumRequestFingerprinter:
+    """Fingerprint requests on their canonical URL so SMF session ids and
+    ``;topicseen`` markers do not defeat the dupefilter or the HTTP cache.
+
+    Topic pages are keyed on ``(topic_id, topic_offset, topic_version)`` alone,
+    so the same page reached through differently formed links is only fetched
+    once, and a JOBDIR run skips pages it already has until the topic gets new
+    replies."""
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        return cls()
+
+    def fingerprint(self, request) -> bytes:
+        topic_id = request.meta.get("topic_id")
+        if topic_id is not None:
+            key = f"topic={topic_id}.{request.meta.get('topic_offset', 0)}"
+            version = request.meta.get("topic_version")
+            if version is not None:
+                key = f"{key}@{version}"
+            return hashlib.sha1(key.encode()).digest()
+        url = canonical_forum_url(request.url)
+        if url != request.url:
+            request = request.replace(url=url)
+        return fingerprint(request)
@@ -0,0 +1,124 @@
+import asyncio
+import logging
+from time import monotonic
+from typing import Optional
+
+import aiohttp
+from scrapy.http import Headers
+from scrapy.responsetypes import responsetypes
+from scrapy_playwright.handler import ScrapyPlaywrightDownloadHandler
+from twisted.internet.defer import CancelledError
+from twisted.internet.error import ConnectionLost, TCPTimedOutError
+
+
+logger = logging.getLogger(__name__)
+
+
+class AiohttpDownloadHandler(ScrapyPlaywrightDownloadHandler):
+    """Fetch requests flagged with ``meta["aiohttp"]`` through one pooled aiohttp session.
+
+    Anything else is handed to scrapy-playwright, which renders
+    ``meta["playwright"]`` requests and sends the rest through Scrapy's HTTP handler.
+    """
+
+    def __init__(self, crawler) -> None:
+        super().__init__(crawler)
+        settings = crawler.settings
+        self._limit = settings.getint("AIOHTTP_CONNECTION_LIMIT", 64)
+        self._limit_per_host = settings.getint("AIOHTTP_CONNECTION_LIMIT_PER_HOST", 16)
+        self._default_timeout = settings.getfloat("DOWNLOAD_TIMEOUT", 180)
+        self._default_maxsize = settings.getint("DOWNLOAD_MAXSIZE")
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def download_request(self, request):
+        if request.meta.get("aiohttp") and not request.meta.get("playwright"):
+            return await self._download_aiohttp(request)
+        return await super().download_request(request)
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None:
+            connector = aiohttp.TCPConnector(
+                limit=self._limit,
+                limit_per_host=self._limit_per_host,
+                ttl_dns_cache=300,
+            )
+            # Cookies, redirects and decompression stay with Scrapy's middlewares.
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                cookie_jar=aiohttp.DummyCookieJar(),
+                auto_decompress=False,
+            )
+        return self._session
+
+    async def _download_aiohttp(self, request):
+        timeout = aiohttp.ClientTimeout(
+            total=request.meta.get("download_timeout", self._default_timeout)
+        )
+        headers = [
+            (key.decode("latin-1"), value.decode("latin-1"))
+            for key, values in request.headers.items()
+            for value in values
+        ]
+        maxsize = request.meta.get("download_maxsize", self._default_maxsize)
+        start_time = monotonic()
+        # Disconnects, truncated payloads and timeouts from aiohttp are not
+        # OSErrors, so RetryMiddleware would give up on them; surface them as
+        # the Twisted errors it retries.
+        try:
+            async with self._get_session().request(
+                request.method,
+                request.url,
+                headers=headers,
+                data=request.body or None,
+                timeout=timeout,
+                allow_redirects=False,
+            ) as resp:
+                # AutoThrottle derives its delays from this, like with Scrapy's
+                # own handler: time to response headers.
+                request.meta["download_latency"] = monotonic() - start_time
+                body = await self._read_body(resp, request, maxsize)
+                response_headers = Headers()
+                for key, value in resp.raw_headers:
+                    response_headers.appendlist(key, value)
+                respcls = responsetypes.from_args(headers=response_headers, url=request.url, body=body)
+                return respcls(
+                    url=request.url,
+                    status=resp.status,
+                    headers=response_headers,
+                    body=body,
+                    request=request,
+                    protocol=f"HTTP/{resp.version.major}.{resp.version.minor}",
+                )
+        except asyncio.TimeoutError as exc:
+            raise TCPTimedOutError(f"Getting {request.url} took longer than {timeout.total} seconds.") from exc
+        except aiohttp.ClientError as exc:
+            raise ConnectionLost(f"{type(exc).__name__}: {exc}") from exc
+
+    @staticmethod
+    async def _read_body(resp: aiohttp.ClientResponse, request, maxsize: int) -> bytes:
+        """Read the response body, cancelling the download past ``maxsize`` bytes."""
+        if maxsize and (resp.content_length or 0) > maxsize:
+            raise _maxsize_exceeded(request, resp.content_length, maxsize, expected=True)
+        chunks = []
+        received = 0
+        async for chunk in resp.content.iter_chunked(65536):
+            received += len(chunk)
+            if maxsize and received > maxsize:
+                raise _maxsize_exceeded(request, received, maxsize, expected=False)
+            chunks.append(chunk)
+        return b"".join(chunks)
+
+    async def close(self) -> None:
+        await super().close()
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+def _maxsize_exceeded(request, size: int, maxsize: int, expected: bool) -> CancelledError:
+    message = (
+        f"{'Expected' if expected else 'Received'} response size ({size}) larger than "
+        f"download max size ({maxsize}) in request {request}."
+    )
+    logger.warning(message)
+    return CancelledError(message)
@@ -1,51 +1,52 @@
 import dataclasses
-from typing import List, Optional
+from typing import Dict, List, Optional
 
-import scrapy
 
+@dataclasses.dataclass(slots=True)
+class BoardInfoItem:
+    board_id: Optional[str] = None
+    name: Optional[str] = None
+    description: Optional[str] = None
+    topics: Optional[int] = None
+    posts: Optional[int] = None
+    url: Optional[str] = None
 
-class BoardInfoItem(scrapy.Item):
-    board_id = scrapy.Field()
-    name = scrapy.Field()
-    description = scrapy.Field()
-    topics = scrapy.Field()
-    posts = scrapy.Field()
-    url = scrapy.Field()
 
+@dataclasses.dataclass(slots=True)
+class TopicSummaryItem:
+    board_id: Optional[str] = None
+    board_offset: Optional[int] = None
+    topic_id: Optional[str] = None
+    subject: Optional[str] = None
+    starter: Optional[str] = None
+    replies: Optional[int] = None
+    views: Optional[int] = None
+    last_post_author: Optional[str] = None
+    last_post_time: Optional[str] = None
+    last_post_link: Optional[str] = None
+    topic_url: Optional[str] = None
+    page_url: Optional[str] = None
 
-class TopicSummaryItem(scrapy.Item):
-    board_id = scrapy.Field()
-    board_offset = scrapy.Field()
-    topic_id = scrapy.Field()
-    subject = scrapy.Field()
-    starter = scrapy.Field()
-    replies = scrapy.Field()
-    views = scrapy.Field()
-    last_post_author = scrapy.Field()
-    last_post_time = scrapy.Field()
-    last_post_link = scrapy.Field()
-    topic_url = scrapy.Field()
-    page_url = scrapy.Field()
 
-
-class PostItem(scrapy.Item):
-    board_id = scrapy.Field()
-    topic_id = scrapy.Field()
-    post_id = scrapy.Field()
-    position = scrapy.Field()
-    author_name = scrapy.Field()
-    author_profile = scrapy.Field()
-    author_title = scrapy.Field()
-    author_details = scrapy.Field()
-    subject = scrapy.Field()
-    posted_at = scrapy.Field()
-    permalink = scrapy.Field()
-    content_html = scrapy.Field()
-    content_text = scrapy.Field()
-    extracted_text = scrapy.Field()
-    signature_html = scrapy.Field()
-    signature_text = scrapy.Field()
-    edited = scrapy.Field()
-    likes = scrapy.Field()
-    attachments = scrapy.Field()
-    page_url = scrapy.Field()
+@dataclasses.dataclass(slots=True)
+class PostItem:
+    board_id: Optional[str] = None
+    topic_id: Optional[str] = None
+    post_id: Optional[str] = None
+    position: Optional[int] = None
+    author_name: Optional[str] = None
+    author_profile: Optional[str] = None
+    author_title: Optional[str] = None
+    author_details: List[str] = dataclasses.field(default_factory=list)
+    subject: Optional[str] = None
+    posted_at: Optional[str] = None
+    permalink: Optional[str] = None
+    content_html: Optional[Dict] = None
+    content_text: Optional[str] = None
+    extracted_text: Optional[str] = None
+    signature_html: Optional[Dict] = None
+    signature_text: Optional[str] = None
+    edited: Optional[str] = None
+    likes: Optional[int] = None
+    attachments: List[dict] = dataclasses.field(default_factory=list)
+    page_url: Optional[str] = None
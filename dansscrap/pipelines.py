@@ -1,70 +1,181 @@
-import json
-from collections import defaultdict
+import abc
+import dataclasses
+import time
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import BinaryIO, Dict, List, Tuple
 
-from itemadapter import ItemAdapter
+import orjson
 
 from . import settings as project_settings
 from .items import BoardInfoItem, PostItem, TopicSummaryItem
 
 
+# Snapshot files stay human-readable; keys keep their insertion order.
+_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+
+_now_second = -1
+_now_iso = ""
+
+
 def iso_now() -> str:
-    return datetime.now(timezone.utc).isoformat()
+    """UTC timestamp for ``fetched_at``; formatted at most once per wall-clock second."""
+    global _now_second, _now_iso
+    now = time.time()
+    if int(now) != _now_second:
+        _now_second = int(now)
+        _now_iso = datetime.fromtimestamp(now, timezone.utc).isoformat()
+    return _now_iso
+
+
+_FIELD_NAMES = {
+    cls: tuple(field.name for field in dataclasses.fields(cls))
+    for cls in (BoardInfoItem, TopicSummaryItem, PostItem)
+}
+
+
+def _as_payload(item) -> Dict:
+    """Shallow dict of a known item's fields plus ``fetched_at``.
+
+    Unlike ``dataclasses.asdict`` this does not deep-copy the list fields,
+    which the pipeline only ever reads.
+    """
+    payload = {name: getattr(item, name) for name in _FIELD_NAMES[type(item)]}
+    payload["fetched_at"] = iso_now()
+    return payload
+
+
+class BatchingPipeline(abc.ABC):
+    """Base for pipelines that persist entries ``batch_size`` at a time.
+
+    Subclasses queue entries with :meth:`add_to_batch` and implement
+    :meth:`process_batch`; items still pass through ``process_item`` one by one
+    so feed exports and later pipelines see every item.
+    """
 
+    def __init__(self, batch_size: int = 500) -> None:
+        self.batch_size = batch_size
+        self._batch: List = []
 
-class PostStorePipeline:
-    def __init__(self, data_dir: Path | None = None) -> None:
+    def add_to_batch(self, entry) -> None:
+        self._batch.append(entry)
+        if len(self._batch) >= self.batch_size:
+            self.flush_batch()
+
+    def flush_batch(self) -> None:
+        if self._batch:
+            batch, self._batch = self._batch, []
+            self.process_batch(batch)
+
+    @abc.abstractmethod
+    def process_batch(self, batch: List) -> None:
+        """Persist one full batch of queued entries."""
+
+    def close_spider(self, spider):
+        self.flush_batch()
+
+
+class PostStorePipeline(BatchingPipeline):
+    """Persist board metadata, topic summaries and posts under ``data_dir``.
+
+    Posts are written through to per-topic JSONL logs, so only the current
+    batch of encoded lines, the board info and the topic summaries stay in
+    memory; the logs are folded into ``topics/<id>.json`` at close.
+    """
+
+    def __init__(
+        self,
+        data_dir: Path | None = None,
+        batch_size: int = 500,
+        max_open_files: int = 256,
+        compact_topics: bool = True,
+    ) -> None:
+        super().__init__(batch_size)
         base = data_dir or project_settings.DATA_DIR
         self.data_dir = Path(base)
+        self.max_open_files = max_open_files
+        self.compact_topics = compact_topics
         self.board_info: Dict[str, Dict] = {}
-        self.topic_summaries: Dict[str, Dict[str, Dict]] = defaultdict(dict)
-        self.topic_posts: Dict[Tuple[str, str], Dict[str, Dict]] = defaultdict(dict)
+        self.topic_summaries: Dict[Tuple[str, str], Dict] = {}
+        self._handles: "OrderedDict[Path, BinaryIO]" = OrderedDict()
 
     @classmethod
     def from_crawler(cls, crawler):
         data_dir = crawler.settings.get("DATA_DIR")
-        return cls(Path(data_dir) if data_dir else None)
+        return cls(
+            Path(data_dir) if data_dir else None,
+            batch_size=crawler.settings.getint("POST_STORE_BATCH_SIZE", 500),
+            max_open_files=crawler.settings.getint("POST_STORE_MAX_OPEN_FILES", 256),
+            compact_topics=crawler.settings.getbool("POST_STORE_COMPACT_TOPICS", True),
+        )
 
     def open_spider(self, spider):
         self.data_dir.mkdir(exist_ok=True)
 
     def process_item(self, item, spider):
-        adapter = ItemAdapter(item)
         if isinstance(item, BoardInfoItem):
-            board_id = adapter["board_id"]
-            payload = adapter.asdict()
-            payload["fetched_at"] = iso_now()
-            self.board_info[board_id] = payload
+            payload = _as_payload(item)
+            self.board_info[item.board_id] = payload
             return item
 
         if isinstance(item, TopicSummaryItem):
-            board_id = adapter["board_id"]
-            topic_id = adapter["topic_id"]
-            payload = adapter.asdict()
-            payload["fetched_at"] = iso_now()
-            self.topic_summaries[board_id][topic_id] = payload
+            payload = _as_payload(item)
+            self.topic_summaries[(item.board_id, item.topic_id)] = payload
             return item
 
         if isinstance(item, PostItem):
-            board_id = adapter["board_id"]
-            topic_id = adapter["topic_id"]
-            post_id = adapter["post_id"]
-            payload = adapter.asdict()
-            payload["fetched_at"] = iso_now()
-            self.topic_posts[(board_id, topic_id)][post_id] = payload
+            board_id = item.board_id
+            topic_id = item.topic_id
+            payload = _as_payload(item)
+            # Queue the encoded line, not the dict: a few hundred bytes per post
+            # instead of a dict of Python strings.
+            self.add_to_batch(
+                (board_id, topic_id, orjson.dumps(payload, option=orjson.OPT_APPEND_NEWLINE))
+            )
             return item
 
         return item
 
+    def process_batch(self, batch: List[Tuple[str, str, bytes]]) -> None:
+        """Append buffered posts to their topic logs, one write per topic."""
+        grouped: Dict[Tuple[str, str], List[bytes]] = defaultdict(list)
+        for board_id, topic_id, line in batch:
+            grouped[(board_id, topic_id)].append(line)
+        for (board_id, topic_id), lines in grouped.items():
+            handle = self._log_handle(self._board_dir(board_id) / "topics" / f"{topic_id}.jsonl")
+            handle.write(b"".join(lines))
+            handle.flush()
+
+    def _log_handle(self, path: Path) -> BinaryIO:
+        """Return an append handle for ``path`` from a bounded LRU of open files."""
+        handle = self._handles.pop(path, None)
+        if handle is None:
+            if len(self._handles) >= self.max_open_files:
+                _, oldest = self._handles.popitem(last=False)
+                oldest.close()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            handle = path.open("ab")
+        self._handles[path] = handle
+        return handle
+
     def close_spider(self, spider):
+        super().close_spider(spider)
+        for handle in self._handles.values():
+            handle.close()
+        self._handles.clear()
+
         for board_id, info in self.board_info.items():
             board_path = self._board_dir(board_id)
             board_path.mkdir(parents=True, exist_ok=True)
             self._merge_json(board_path / "board_info.json", info, overwrite=True)
 
-        for board_id, topics in self.topic_summaries.items():
+        ordered = sorted(self.topic_summaries.items(), key=lambda entry: entry[0])
+        for board_id, entries in groupby(ordered, key=lambda entry: entry[0][0]):
+            topics = {topic_id: payload for (_, topic_id), payload in entries}
             board_path = self._board_dir(board_id)
             board_path.mkdir(parents=True, exist_ok=True)
             index_file = board_path / "topics_index.json"
@@ -80,26 +191,42 @@ class PostStorePipeline:
                 payload["board_name"] = self.board_info[board_id].get("name")
             self._write_json(index_file, payload)
 
-        for (board_id, topic_id), posts in self.topic_posts.items():
-            board_path = self._board_dir(board_id)
-            topic_dir = board_path / "topics"
-            topic_dir.mkdir(parents=True, exist_ok=True)
-            topic_file = topic_dir / f"{topic_id}.json"
-            existing = self._load_json(topic_file, default={})
-            stored_posts = {p["post_id"]: p for p in existing.get("posts", [])} if existing else {}
-            stored_posts.update(posts)
-            payload = existing or {}
-            payload.update({
-                "board_id": board_id,
-                "topic_id": topic_id,
-                "posts_total": len(stored_posts),
-                "updated_at": iso_now(),
-                "posts": sorted(
-                    stored_posts.values(),
-                    key=lambda p: (p.get("position", 0), p["post_id"]),
-                ),
-            })
-            self._write_json(topic_file, payload)
+        if not self.compact_topics:
+            return
+        # Logs left behind by an interrupted run are merged here as well. Each
+        # topic is independent file I/O, so fan the rewrites out over threads.
+        log_files = sorted(self.data_dir.glob("board_*/topics/*.jsonl"))
+        if log_files:
+            with ThreadPoolExecutor(max_workers=min(8, len(log_files))) as pool:
+                # list() re-raises the first failure instead of dropping it.
+                list(pool.map(self._compact_topic, log_files))
+
+    def _compact_topic(self, log_file: Path) -> None:
+        board_id = log_file.parent.parent.name[len("board_"):]
+        topic_id = log_file.stem
+        topic_file = log_file.with_suffix(".json")
+        existing = self._load_json(topic_file, default={})
+        stored_posts = {p["post_id"]: p for p in existing.get("posts", [])} if existing else {}
+        with log_file.open("rb") as handle:
+            for line in handle:
+                try:
+                    post = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    continue
+                stored_posts[post["post_id"]] = post
+        payload = existing or {}
+        payload.update({
+            "board_id": board_id,
+            "topic_id": topic_id,
+            "posts_total": len(stored_posts),
+            "updated_at": iso_now(),
+            "posts": sorted(
+                stored_posts.values(),
+                key=lambda p: (p.get("position", 0), p["post_id"]),
+            ),
+        })
+        self._write_json(topic_file, payload)
+        log_file.unlink()
 
     def _board_dir(self, board_id: str) -> Path:
         return self.data_dir / f"board_{board_id}"
@@ -108,20 +235,17 @@ class PostStorePipeline:
         if not path.exists():
             return default
         try:
-            with path.open("r", encoding="utf-8") as handle:
-                return json.load(handle)
-        except json.JSONDecodeError:
+            return orjson.loads(path.read_bytes())
+        except orjson.JSONDecodeError:
             return default
 
     def _write_json(self, path: Path, payload: Dict) -> None:
         path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("w", encoding="utf-8") as handle:
-            json.dump(payload, handle, ensure_ascii=False, indent=2)
+        path.write_bytes(orjson.dumps(payload, option=_JSON_OPTIONS))
 
     def _merge_json(self, path: Path, payload: Dict, overwrite: bool = False) -> None:
         if path.exists() and not overwrite:
             existing = self._load_json(path, default={})
             existing.update(payload)
             payload = existing
-        with path.open("w", encoding="utf-8") as handle:
-            json.dump(payload, handle, ensure_ascii=False, indent=2)
+        path.write_bytes(orjson.dumps(payload, option=_JSON_OPTIONS))
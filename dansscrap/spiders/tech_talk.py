@@ -1,62 +1,110 @@
 from __future__ import annotations
 
 import asyncio
-import contextlib
-import json
+import gzip
+import itertools
+import os
 import random
 import re
+import sys
 import time
-import uuid
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, Iterable, Optional, Sequence, Set, Tuple
-from urllib.parse import urlencode
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
 from playwright_stealth import Stealth
-from bs4 import BeautifulSoup
+import orjson
 import scrapy
-import trafilatura
+from lxml import etree
+from lxml.cssselect import CSSSelector
 from scrapy_playwright.page import PageMethod
 import logging
-from playwright.sync_api import sync_playwright
 from scrapy import signals
 
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
-
 from .. import settings as project_settings
 from ..items import BoardInfoItem, PostItem, TopicSummaryItem
 from ..utils import (
     collect_offsets,
     detect_step,
+    first,
+    html_fragment_tree,
+    inner_html,
     next_offset,
     normalize_space,
     parse_int,
     parse_topic_id,
+    text_content,
 )
 
 
 LOGGER = logging.getLogger(__name__)
 _stealth = Stealth()
 
+_COUNT_RE = re.compile(r"\d[\d,]*", re.ASCII)
+
+# CSS selectors are compiled to XPath once here instead of on every query.
+_SEL_BOARD_TITLE = CSSSelector("div.navigate_section li.last span")
+_SEL_HEAD_TITLE = CSSSelector("title")
+_SEL_BOARD_DESCRIPTION = CSSSelector("div#main_content_section > p.description")
+_SEL_BOARD_STATS = CSSSelector("div#main_content_section div.titlebg span.smalltext")
+_SEL_TOPIC_ROWS = CSSSelector("div#messageindex table.table_grid tbody tr")
+_SEL_TOPIC_SUBJECT = CSSSelector("td.subject span[id^='msg_'] > a")
+_SEL_TOPIC_STARTER = CSSSelector("td.subject p a[href*='profile;u=']")
+_SEL_TOPIC_STATS = CSSSelector("td.stats")
+_SEL_TOPIC_LAST_POST = CSSSelector("td.lastpost")
+_SEL_POST_WRAPPERS = CSSSelector("div#forumposts div.post_wrapper")
+_SEL_POST_CONTENT = CSSSelector("div.post div.inner")
+_SEL_POSTER_LINK = CSSSelector("div.poster h4 a")
+_SEL_EXTRA_INFO = CSSSelector("ul[id$='_extra_info']")
+_SEL_POST_SUBJECT = CSSSelector("h5[id^='subject_'] a")
+_SEL_LIST_ITEMS = CSSSelector("li")
+_SEL_MEMBER_GROUP = CSSSelector("li.membergroup")
+_SEL_POST_TIME = CSSSelector("div.keyinfo div.smalltext")
+_SEL_SIGNATURE = CSSSelector("div.signature")
+_SEL_EDITED = CSSSelector("div.moderatorbar div.modified")
+_SEL_LIKES = CSSSelector("div.like_post_box span")
+_SEL_ATTACHMENTS = CSSSelector("div.attachments li")
+# Text of the last-post cell's first <strong> and everything after it up to
+# the next <br>, e.g. "<strong>Today</strong> at 10:05:00 PM<br />by ...".
+_LAST_POST_TIME_TEXT = etree.XPath(
+    "(.//strong)[1]//text()"
+    " | (.//strong)[1]/following-sibling::node()"
+    "[not(self::br)][not(preceding-sibling::br[preceding-sibling::strong])]"
+    "/descendant-or-self::text()"
+)
+
+def close_when_idle(context) -> None:
+    """Close ``context`` once it has no open pages left."""
+
+    def maybe_close(*_args) -> None:
+        if context.pages or getattr(context, "_closing", False):
+            return
+        setattr(context, "_closing", True)
+        asyncio.ensure_future(context.close())
+
+    def watch(page) -> None:
+        page.on("close", maybe_close)
+
+    context.on("page", watch)
+    for page in context.pages:
+        watch(page)
+    maybe_close()
+
+
+async def track_context(page, request):
+    # Every rendered request is routed to a spider callback, which leads back
+    # to the spider that owns the context (also after a JOBDIR restore).
+    spider = getattr(request.callback, "__self__", None)
+    if isinstance(spider, TechTalkSpider):
+        spider._track_context(request.meta.get("playwright_context", "default"), page.context)
+
 
 async def enable_stealth(page, request):
+    await track_context(page, request)
     await _stealth.apply_stealth_async(page)
     page.on("load", lambda: asyncio.create_task(_handle_page_load(page)))
 
 
-def _normalize_same_site(value: Optional[str]) -> str:
-    if not value:
-        return "None"
-    lower = value.lower()
-    if "strict" in lower:
-        return "Strict"
-    if "lax" in lower:
-        return "Lax"
-    return "None"
-
-
 async def _handle_page_load(page) -> None:
     if getattr(page, "_cf_handled", False):
         return
@@ -68,7 +116,7 @@ async def _handle_page_load(page) -> None:
             success = await _attempt_cloudflare_checkbox(page)
             if not success:
                 LOGGER.warning(
-                    "Cloudflare prompt detected. If it persists, click the checkbox in the Playwright window."
+                    "Cloudflare prompt detected. If it persists, rerun with cf_mode=manual to solve it by hand."
                 )
     except Exception as exc:  # pragma: no cover
         LOGGER.debug("Cloudflare handler error: %s", exc, exc_info=True)
@@ -110,26 +158,98 @@ async def _move_mouse_human_like(page, box: Dict[str, float]) -> None:
     start_x = max(0, min(target_x + random.uniform(-180, 180), viewport["width"] - 1))
     start_y = max(0, min(target_y + random.uniform(-150, 150), viewport["height"] - 1))
     points = _generate_mouse_path((start_x, start_y), (target_x, target_y))
+    # The curve is already finely sampled, so each point is a single move.
     for px, py in points:
         px = max(0, min(px, viewport["width"] - 1))
         py = max(0, min(py, viewport["height"] - 1))
-        await page.mouse.move(px, py, steps=random.randint(8, 15))
-        await asyncio.sleep(random.uniform(0.02, 0.08))
-
-
-def _generate_mouse_path(start: Tuple[float, float], end: Tuple[float, float]) -> Sequence[Tuple[float, float]]:
+        await page.mouse.move(px, py, steps=1)
+    await asyncio.sleep(random.uniform(0.05, 0.15))
+
+
+def _generate_mouse_path(
+    start: Tuple[float, float], end: Tuple[float, float], samples: int = 12
+) -> Sequence[Tuple[float, float]]:
+    """Sample a cubic Bezier from ``start`` to ``end`` through two jittered control points."""
+    dx = end[0] - start[0]
+    dy = end[1] - start[1]
+    c1 = (
+        start[0] + dx * random.uniform(0.2, 0.4) + random.uniform(-60, 60),
+        start[1] + dy * random.uniform(0.2, 0.4) + random.uniform(-50, 50),
+    )
+    c2 = (
+        start[0] + dx * random.uniform(0.6, 0.8) + random.uniform(-40, 40),
+        start[1] + dy * random.uniform(0.6, 0.8) + random.uniform(-30, 30),
+    )
     points = []
-    segments = random.randint(3, 6)
-    for i in range(1, segments):
-        t = i / segments
-        jitter = random.uniform(-25, 25)
-        px = start[0] + (end[0] - start[0]) * t + jitter
-        py = start[1] + (end[1] - start[1]) * t + random.uniform(-20, 20)
-        points.append((px, py))
-    points.append(end)
+    for i in range(1, samples + 1):
+        t = i / samples
+        u = 1 - t
+        a, b, c, d = u * u * u, 3 * u * u * t, 3 * u * t * t, t * t * t
+        points.append(
+            (
+                a * start[0] + b * c1[0] + c * c2[0] + d * end[0],
+                a * start[1] + b * c1[1] + c * c2[1] + d * end[1],
+            )
+        )
     return points
 
 
+_EXECUTOR: Optional[ProcessPoolExecutor] = None
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    global _EXECUTOR
+    if _EXECUTOR is None:
+        _EXECUTOR = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _EXECUTOR
+
+
+def _shutdown_executor() -> None:
+    global _EXECUTOR
+    if _EXECUTOR is not None:
+        _EXECUTOR.shutdown(wait=False, cancel_futures=True)
+        _EXECUTOR = None
+
+
+def extract_post_texts(fragments: Sequence[str]) -> List[Optional[str]]:
+    """Return trafilatura's cleaned text per post body; runs in a worker process."""
+    # Only imported when deep_clean is on, and then only in the pool workers.
+    import trafilatura
+
+    results = []
+    for fragment in fragments:
+        results.append(
+            trafilatura.extract(
+                html_fragment_tree(fragment),
+                include_comments=False,
+                include_tables=False,
+                favor_precision=True,
+            )
+        )
+    return results
+
+
+def store_post_html(data_dir: Path, board_id: str, topic_id: str, posts: List[Dict]) -> None:
+    """Gzip each post's raw HTML under ``board_<id>/html/<topic_id>/`` and swap
+    ``content_html``/``signature_html`` for ``{"path", "size"}`` references.
+
+    Runs on a worker thread so the file writes stay off the reactor.
+    """
+    topic_dir = data_dir / f"board_{board_id}" / "html" / topic_id
+    topic_dir.mkdir(parents=True, exist_ok=True)
+    for post in posts:
+        post_id = post["post_id"]
+        for field, name in (("content_html", post_id), ("signature_html", f"{post_id}.signature")):
+            html = post[field]
+            if not html:
+                post[field] = None
+                continue
+            data = html.encode("utf-8")
+            path = topic_dir / f"{name}.html.gz"
+            path.write_bytes(gzip.compress(data, mtime=0))
+            post[field] = {"path": path.relative_to(data_dir).as_posix(), "size": len(data)}
+
+
 class TechTalkSpider(scrapy.Spider):
     name = "tech_talk"
     allowed_domains = ["forums.dansdeals.com"]
@@ -139,10 +259,17 @@ class TechTalkSpider(scrapy.Spider):
         "PLAYWRIGHT_PAGE_CLOSE_ON_ERROR": True,
     }
     cf_max_retries = 3
+    context_pool_size = 4
+    content_wait_ms = 15000
+    cf_retry_wait_ms = 45000
+    bootstrap_timeout_ms = 60000
     default_user_agent = (
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
         "(KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36"
     )
+    # Cloudflare ties its clearance cookie to the browser's User-Agent, so
+    # plain HTTP requests must present the same one as the Playwright context.
+    user_agent = default_user_agent
 
     def __init__(
         self,
@@ -157,6 +284,7 @@ class TechTalkSpider(scrapy.Spider):
         self.bootstrap_mode = kwargs.pop("bootstrap", "auto")
         self.storage_state_ttl = int(kwargs.pop("state_ttl", 12 * 3600))
         self.cf_mode = kwargs.pop("cf_mode", "auto").lower()
+        self.deep_clean = str(kwargs.pop("deep_clean", "false")).lower() in {"1", "true", "yes"}
         if self.cf_mode not in {"auto", "manual"}:
             raise ValueError("cf_mode must be 'auto' or 'manual'")
         super().__init__(*args, **kwargs)
@@ -166,52 +294,114 @@ class TechTalkSpider(scrapy.Spider):
         self.max_topics = int(max_topics) if max_topics else None
         self.topic_max_pages = int(topic_max_pages) if topic_max_pages else None
         self.board_pages_processed = 0
+        self.topics_scheduled = 0
         self.topic_seen: Set[str] = set()
         self.board_metadata_emitted = False
         self.storage_state_path: Optional[Path] = None
         self.data_dir: Optional[Path] = None
-        self.bootstrap_driver = None
-
-    def start_requests(self) -> Iterable[scrapy.Request]:
-        self._ensure_storage_state()
-        params = {"board": f"{self.board_id}.0"}
-        url = f"https://forums.dansdeals.com/index.php?{urlencode(params)}"
+        self._slot_names = [f"ctx-{slot}" for slot in range(self.context_pool_size)]
+        self._slot_generation = 0
+        # Live Playwright contexts keyed by their scrapy-playwright name, so
+        # cookies can be persisted and retired contexts closed.
+        self._contexts: Dict[str, object] = {}
+        # Slot names retired after a challenge. Requests queued before the
+        # retirement may still reopen them; those contexts are closed as soon
+        # as their pages finish.
+        self._retired_contexts: Set[str] = set()
+        # Contexts that have served a clean 200, most recent last; only these
+        # hold cookies worth persisting.
+        self._cleared_contexts: Dict[str, None] = {}
+        self._ctx_iter = itertools.cycle(range(self.context_pool_size))
+
+    async def start(self):
+        # The bootstraps drive Playwright's sync API (and may wait on input()),
+        # which refuses to run inside the reactor's event loop; give them a
+        # loop-free worker thread.
+        await asyncio.to_thread(self._ensure_storage_state)
+        url = f"https://forums.dansdeals.com/index.php?board={self.board_id}.0"
         yield scrapy.Request(
             url,
             meta=self._build_meta({"board_offset": 0, "cf_retry": 0}),
+            # Seed Scrapy's cookie jar so every plain request carries them.
+            cookies=self._storage_cookies(),
             callback=self.parse_board,
+            dont_filter=True,
         )
 
-    def _build_meta(self, extra: Optional[Dict] = None, *, new_context: bool = False) -> Dict:
-        page_methods = [PageMethod("wait_for_load_state", "domcontentloaded")]
+    def _storage_cookies(self) -> List[Dict]:
+        if not self.storage_state_path or not self.storage_state_path.exists():
+            return []
+        try:
+            state = orjson.loads(self.storage_state_path.read_bytes())
+        except (OSError, ValueError) as exc:
+            self.logger.warning("Could not read storage state cookies: %s", exc)
+            return []
+        return [
+            {
+                "name": cookie["name"],
+                "value": cookie["value"],
+                "domain": cookie.get("domain"),
+                "path": cookie.get("path", "/"),
+                "secure": cookie.get("secure", False),
+            }
+            for cookie in state.get("cookies", [])
+        ]
+
+    def _build_meta(
+        self,
+        extra: Optional[Dict] = None,
+        *,
+        playwright: bool = False,
+        context: Optional[str] = None,
+    ) -> Dict:
+        if not playwright:
+            meta: Dict = {"playwright": False, "aiohttp": True}
+            if extra:
+                meta.update(extra)
+            return meta
+
+        retrying = bool(extra and extra.get("cf_retry"))
+        # goto() already resolves at domcontentloaded, so no separate
+        # wait_for_load_state step is needed.
+        page_methods = []
         if self.cf_mode != "manual":
-            page_methods.extend(
-                [
-                    PageMethod("wait_for_load_state", "networkidle"),
-                    PageMethod("wait_for_timeout", 8000),
-                ]
+            # Forum pages are complete once the content wrapper exists; give
+            # retries extra time for the challenge to redirect there.
+            page_methods.append(
+                PageMethod(
+                    "wait_for_selector",
+                    "div#main_content_section",
+                    state="attached",
+                    timeout=self.cf_retry_wait_ms if retrying else self.content_wait_ms,
+                )
             )
-        meta: Dict = {
+        meta = {
             "playwright": True,
             "playwright_page_methods": page_methods,
+            "playwright_page_goto_kwargs": {"wait_until": "domcontentloaded"},
             "playwright_context_kwargs": {
                 "ignore_https_errors": True,
                 "user_agent": self.default_user_agent,
                 "viewport": {"width": 1280, "height": 720},
             },
         }
-        if self.cf_mode != "manual":
-            meta["playwright_page_init_callback"] = enable_stealth
+        meta["playwright_page_init_callback"] = (
+            track_context if self.cf_mode == "manual" else enable_stealth
+        )
         if self.storage_state_path and self.storage_state_path.exists():
             meta["playwright_context_kwargs"]["storage_state"] = str(self.storage_state_path)
-        if new_context:
-            meta["playwright_context"] = f"context-{uuid.uuid4()}"
+        # Contexts are long-lived pool slots, created on first use and
+        # handed out round-robin so warm cookies and caches are reused.
+        meta["playwright_context"] = context or self._slot_names[next(self._ctx_iter)]
         if extra:
             meta.update(extra)
         return meta
 
     def _retry_with_new_context(self, response: scrapy.http.Response) -> Optional[scrapy.Request]:
-        if self.cf_mode == "manual":
+        # Plain HTTP requests escalate to Playwright first; only rendered
+        # requests that still fail get a fresh browser context.
+        escalate = not response.meta.get("playwright")
+        if self.cf_mode == "manual" and not escalate:
             self.logger.error("Manual mode encountered HTTP %s on %s; aborting retries.", response.status, response.url)
             return None
 
@@ -222,11 +412,17 @@ class TechTalkSpider(scrapy.Spider):
         extra: Dict = {
             key: value
             for key, value in response.meta.items()
-            if key in {"board_offset", "topic_offset", "board_id", "topic_id"}
+            if key in {"board_offset", "topic_offset", "topic_version", "board_id", "topic_id"}
         }
         extra["cf_retry"] = retry_count + 1
+        context = None
+        if not escalate:
+            # Only the slot that actually got challenged is retired.
+            context = response.meta.get("playwright_context")
+            if context:
+                context = self._retire_context(context)
         request = response.request.replace(
-            meta=self._build_meta(extra, new_context=True),
+            meta=self._build_meta(extra, playwright=True, context=context),
             dont_filter=True,
         )
         self.logger.warning(
@@ -238,23 +434,88 @@ class TechTalkSpider(scrapy.Spider):
         )
         return request
 
+    def _retire_context(self, name: str) -> str:
+        # Other pages may still be rendering in the challenged context, so it
+        # is not closed outright: its slot moves to a fresh context name (which
+        # scrapy-playwright creates with the current storage state) and the old
+        # context closes once its last page is done.
+        try:
+            slot = self._slot_names.index(name)
+        except ValueError:
+            # Already retired by a concurrent challenge.
+            slot = next(self._ctx_iter)
+        else:
+            self._slot_generation += 1
+            self._slot_names[slot] = f"ctx-{slot}-{self._slot_generation}"
+            self._retired_contexts.add(name)
+            self._cleared_contexts.pop(name, None)
+            context = self._contexts.get(name)
+            if context is not None:
+                close_when_idle(context)
+        return self._slot_names[slot]
+
+    def _track_context(self, name: str, context) -> None:
+        if self._contexts.get(name) is context:
+            return
+        self._contexts[name] = context
+        context.on("close", lambda ctx: self._forget_context(name, ctx))
+        if name in self._retired_contexts:
+            close_when_idle(context)
+
+    def _forget_context(self, name: str, context) -> None:
+        if self._contexts.get(name) is context:
+            del self._contexts[name]
+
     @classmethod
     def from_crawler(cls, crawler, *args, **kwargs):
         spider = super().from_crawler(crawler, *args, **kwargs)
         spider.storage_state_ttl = crawler.settings.getint(
             "PLAYWRIGHT_STATE_TTL", spider.storage_state_ttl
         )
+        pool_size = crawler.settings.getint("PLAYWRIGHT_MAX_CONTEXTS", spider.context_pool_size)
+        if pool_size != spider.context_pool_size:
+            spider.context_pool_size = pool_size
+            spider._slot_names = [f"ctx-{slot}" for slot in range(pool_size)]
+            spider._ctx_iter = itertools.cycle(range(pool_size))
         data_dir_setting = crawler.settings.get("DATA_DIR")
         if data_dir_setting:
             spider.data_dir = Path(data_dir_setting)
         crawler.signals.connect(spider.spider_closed, signal=signals.spider_closed)
         return spider
 
-    def spider_closed(self):
-        if self.bootstrap_driver:
-            with contextlib.suppress(Exception):
-                self.bootstrap_driver.quit()
-            self.bootstrap_driver = None
+    async def spider_closed(self):
+        await self._persist_storage_state()
+        self._contexts.clear()
+        self._retired_contexts.clear()
+        self._cleared_contexts.clear()
+        _shutdown_executor()
+
+    def _mark_context_cleared(self, response: scrapy.http.Response) -> None:
+        name = response.meta.get("playwright_context")
+        if response.meta.get("playwright") and name and response.status == 200:
+            self._cleared_contexts.pop(name, None)
+            self._cleared_contexts[name] = None
+
+    async def _persist_storage_state(self) -> None:
+        # Only a context that got past the challenge is saved: writing the file
+        # refreshes its mtime, so a jar without clearance would otherwise count
+        # as fresh for the whole TTL. The latest one has the freshest cookies.
+        context = next(
+            (
+                self._contexts[name]
+                for name in reversed(list(self._cleared_contexts))
+                if name in self._contexts
+            ),
+            None,
+        )
+        if context is None or self.storage_state_path is None:
+            return
+        try:
+            await context.storage_state(path=str(self.storage_state_path))
+        except Exception as exc:
+            self.logger.debug("Could not persist Playwright storage state: %s", exc)
+            return
+        self.logger.info("Updated Playwright storage state at %s", self.storage_state_path)
 
     def _prompt(self, message: str, default: str = "") -> str:
         try:
@@ -265,12 +526,14 @@ class TechTalkSpider(scrapy.Spider):
 
     def _manual_playwright_bootstrap(self, storage_path: Path) -> Dict:
         self.logger.info("Manual mode: launching Chromium window for you to solve Cloudflare.")
+        from playwright.sync_api import sync_playwright
+
         launch_opts = project_settings.PLAYWRIGHT_LAUNCH_OPTIONS
         args = launch_opts.get("args", [])
-        headless = launch_opts.get("headless", False)
 
         with sync_playwright() as playwright:
-            browser = playwright.chromium.launch(headless=headless, args=args)
+            # The crawl itself runs headless, but this window has to be visible.
+            browser = playwright.chromium.launch(headless=False, args=args)
             context = browser.new_context(
                 user_agent=self.default_user_agent,
                 viewport={"width": 1280, "height": 720},
@@ -312,118 +575,59 @@ class TechTalkSpider(scrapy.Spider):
                     "Cloudflare page still loading. Finish the challenge in the Chromium window, then press Enter again."
                 )
             state = context.storage_state()
-            storage_path.write_text(json.dumps(state, indent=2), encoding="utf-8")
+            storage_path.write_bytes(orjson.dumps(state))
             self.logger.info("Manual storage state captured at %s", storage_path)
             context.close()
             browser.close()
             return state
 
     def _auto_bootstrap(self) -> Dict:
-        self.logger.info("Bootstrapping Cloudflare cookies with undetected_chromedriver.")
-        try:
-            import undetected_chromedriver as uc
-        except ImportError:  # pragma: no cover
-            self.logger.error("undetected_chromedriver is not installed; cannot bootstrap session.")
-            return {}
-
-        options = uc.ChromeOptions()
-        options.add_argument("--disable-gpu")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--window-size=1920,1080")
-        options.add_argument("--start-maximized")
-        options.add_argument("--disable-blink-features=AutomationControlled")
-        driver = uc.Chrome(options=options)
-        self.bootstrap_driver = driver
-        close_driver = False
-        cookies = []
-        try:
-            driver.get("https://forums.dansdeals.com/index.php")
-            solved = False
+        self.logger.info("Bootstrapping Cloudflare cookies with a headless Playwright browser.")
+        from playwright.sync_api import TimeoutError as PlaywrightTimeoutError, sync_playwright
+
+        launch_opts = project_settings.PLAYWRIGHT_LAUNCH_OPTIONS
+        with sync_playwright() as playwright:
+            browser = playwright.chromium.launch(**launch_opts)
+            context = browser.new_context(
+                user_agent=self.default_user_agent,
+                viewport={"width": 1280, "height": 720},
+            )
+            page = context.new_page()
+            _stealth.apply_stealth_sync(page)
             try:
-                WebDriverWait(driver, 120).until(
-                    lambda d: d.execute_script("return document.readyState") == "complete"
-                    and bool(d.find_elements(By.CSS_SELECTOR, "div#main_content_section"))
+                page.goto("https://forums.dansdeals.com/index.php", wait_until="domcontentloaded")
+                page.wait_for_selector(
+                    "div#main_content_section",
+                    state="attached",
+                    timeout=self.bootstrap_timeout_ms,
                 )
-                solved = True
-            except TimeoutException:
+            except PlaywrightTimeoutError:
                 self.logger.warning(
-                    "Cloudflare challenge still active. Solve it in the helper window, then confirm here."
+                    "Cloudflare challenge was not cleared headlessly; rerun with cf_mode=manual to solve it by hand."
                 )
-
-            if not solved:
-                manual_deadline = time.time() + 300
-                while True:
-                    try:
-                        title = (driver.title or "").lower()
-                        ready = driver.execute_script("return document.readyState")
-                        has_main = bool(driver.find_elements(By.CSS_SELECTOR, "div#main_content_section"))
-                    except Exception:
-                        break
-                    if "just a moment" not in title and "attention required" not in title and ready == "complete" and has_main:
-                        solved = True
-                        break
-                    if time.time() > manual_deadline:
-                        self.logger.warning("Manual wait timed out; continuing without confirmed cookies.")
-                        break
-                    response = self._prompt(
-                        "Type DONE when the forum loads (SKIP to continue without cookies): ",
-                        default="done",
-                    ).lower()
-                    if response == "skip":
-                        break
-                    if response not in ("done", ""):
-                        print("Unrecognised response. Type DONE or SKIP.")
-                        continue
-                    print("Still waiting for the Cloudflare page to finish loading...")
-                    time.sleep(2)
-            cookies = driver.get_cookies()
-            if solved and cookies:
-                answer = self._prompt(
-                    "Cloudflare cleared. Close helper window now? [Y/n]: ", default="y"
-                ).lower()
-                if answer in ("", "y", "yes"):
-                    close_driver = True
-                else:
-                    self.logger.info("Keeping helper window open; close it manually when convenient.")
-        finally:
-            if close_driver:
-                with contextlib.suppress(Exception):
-                    driver.quit()
-                self.bootstrap_driver = None
-
-        formatted = [
-            {
-                "name": cookie.get("name"),
-                "value": cookie.get("value"),
-                "domain": cookie.get("domain") or "forums.dansdeals.com",
-                "path": cookie.get("path") or "/",
-                "expires": cookie.get("expiry", -1),
-                "httpOnly": cookie.get("httpOnly", False),
-                "secure": cookie.get("secure", True),
-                "sameSite": _normalize_same_site(cookie.get("sameSite")),
-            }
-            for cookie in cookies
-            if cookie.get("name") and cookie.get("value")
-        ]
-
-        return {
-            "cookies": formatted,
-            "origins": [
-                {
-                    "origin": "https://forums.dansdeals.com",
-                    "localStorage": [],
-                    "sessionStorage": [],
-                }
-            ],
-        }
+                return {}
+            else:
+                return context.storage_state()
+            finally:
+                context.close()
+                browser.close()
+
+    @staticmethod
+    def _intern(value: Optional[str]) -> Optional[str]:
+        # Author metadata repeats across thousands of posts; share one copy.
+        return sys.intern(value) if isinstance(value, str) else value
 
     def _ensure_storage_state(self) -> None:
-        base_dir = self.data_dir or (Path(__file__).resolve().parent.parent / "output")
+        base_dir = self.data_dir or project_settings.DATA_DIR
         base_dir.mkdir(parents=True, exist_ok=True)
         storage_path = base_dir / "playwright_state.json"
         self.storage_state_path = storage_path
-        if storage_path.exists():
-            age = time.time() - storage_path.stat().st_mtime
+        try:
+            mtime: Optional[float] = storage_path.stat().st_mtime
+        except FileNotFoundError:
+            mtime = None
+        if mtime is not None:
+            age = time.time() - mtime
             if age < self.storage_state_ttl:
                 self.logger.debug(
                     "Reusing existing Playwright storage state (%ss old)",
@@ -449,46 +653,63 @@ class TechTalkSpider(scrapy.Spider):
             self.logger.warning("No cookies captured during bootstrap; continuing without storage state.")
             return
 
-        storage_path.write_text(json.dumps(state, indent=2), encoding="utf-8")
+        storage_path.write_bytes(orjson.dumps(state))
         self.logger.info("Stored Playwright storage state at %s", storage_path)
 
-    def parse_board(self, response: scrapy.http.Response):
+    @staticmethod
+    async def _parsed_root(response: scrapy.http.Response):
+        # Building response.selector runs the lxml parse, which releases the
+        # GIL; doing it on a worker thread keeps the reactor free meanwhile.
+        selector = await asyncio.to_thread(lambda: response.selector)
+        return selector.root
+
+    async def parse_board(self, response: scrapy.http.Response):
         if response.status in (403, 520):
             retry_request = self._retry_with_new_context(response)
             if retry_request:
                 yield retry_request
             return
+        self._mark_context_cleared(response)
         board_offset = response.meta.get("board_offset", 0)
-        soup = BeautifulSoup(response.text, "html.parser")
+        root = await self._parsed_root(response)
 
-        if not self.board_metadata_emitted:
-            info_item = self._build_board_info(soup, response.url)
-            if info_item:
-                yield info_item
-            self.board_metadata_emitted = True
+        info_item = self._build_board_info(root, response.url)
+        if info_item:
+            yield info_item
 
-        topics = self._extract_topics(soup, board_offset, response.url)
-        for topic in topics:
-            if topic["topic_id"] in self.topic_seen:
+        # Rows are extracted lazily, so the remaining ones are never parsed once
+        # the budget is spent. Only topics that are new to this run (and, under
+        # JOBDIR, changed since the last one) count against max_topics.
+        for topic in self._extract_topics(root, board_offset, response.url):
+            if self.max_topics and self.topics_scheduled >= self.max_topics:
+                return
+            topic_id = topic["topic_id"]
+            # Sticky topics repeat on every listing page.
+            if topic_id in self.topic_seen:
                 continue
-            if self.max_topics and len(self.topic_seen) >= self.max_topics:
-                break
-            self.topic_seen.add(topic["topic_id"])
+            self.topic_seen.add(topic_id)
             yield TopicSummaryItem(**topic)
-            if self.fetch_posts:
-                yield from self._schedule_topic(topic["topic_id"], topic["topic_url"], 0)
+            if not self.fetch_posts:
+                self.topics_scheduled += 1
+                continue
+            version = topic["replies"]
+            if self._topic_unchanged(topic_id, version):
+                continue
+            self.topics_scheduled += 1
+            yield self._schedule_topic(topic_id, topic["topic_url"], 0, version)
+        if self.max_topics and self.topics_scheduled >= self.max_topics:
+            return
 
         self.board_pages_processed += 1
         if self.max_board_pages and self.board_pages_processed >= self.max_board_pages:
             return
 
-        offsets = collect_offsets(soup, "board", self.board_id)
+        offsets = collect_offsets(root, "board", self.board_id)
         step = detect_step(offsets, 25)
         next_off = next_offset(offsets, board_offset)
         if next_off is None:
             return
-        params = {"board": f"{self.board_id}.{next_off}"}
-        next_url = f"https://forums.dansdeals.com/index.php?{urlencode(params)}"
+        next_url = f"https://forums.dansdeals.com/index.php?board={self.board_id}.{next_off}"
         meta = self._build_meta(
             {
                 "board_offset": next_off,
@@ -500,82 +721,85 @@ class TechTalkSpider(scrapy.Spider):
             next_url,
             callback=self.parse_board,
             meta=meta,
+            # Listing pages change between runs; always refetch them.
+            dont_filter=True,
         )
 
-    def _build_board_info(self, soup: BeautifulSoup, url: str) -> Optional[BoardInfoItem]:
-        title_el = soup.select_one("div.navigate_section li.last span")
-        title = title_el.get_text(strip=True) if title_el else None
+    def _build_board_info(self, root, url: str) -> Optional[BoardInfoItem]:
+        # Board metadata only comes from the first listing page; later pages
+        # return before running any selectors.
+        if self.board_metadata_emitted:
+            return None
+        self.board_metadata_emitted = True
+        title_el = first(_SEL_BOARD_TITLE, root)
+        title = text_content(title_el, "") if title_el is not None else None
         if not title:
-            head_title = soup.select_one("title")
-            title = head_title.get_text(strip=True) if head_title else f"Board {self.board_id}"
-        description_el = soup.select_one("div#main_content_section > p.description")
+            head_title = first(_SEL_HEAD_TITLE, root)
+            title = text_content(head_title, "") if head_title is not None else f"Board {self.board_id}"
+        description_el = first(_SEL_BOARD_DESCRIPTION, root)
         description = (
-            description_el.get_text(" ", strip=True) if description_el else ""
+            text_content(description_el, " ") if description_el is not None else ""
         )
         stats_text = ""
-        stat_rows = soup.select("div#main_content_section div.titlebg span.smalltext")
+        stat_rows = _SEL_BOARD_STATS(root)
         if stat_rows:
-            stats_text = " ".join(normalize_space(row.get_text(" ", strip=True)) for row in stat_rows)
+            stats_text = " ".join(normalize_space(text_content(row, " ")) for row in stat_rows)
         posts = parse_int(stats_text) if stats_text else None
-        info = BoardInfoItem()
-        info["board_id"] = self.board_id
-        info["name"] = title
-        info["description"] = description
-        info["topics"] = None
-        info["posts"] = posts
-        info["url"] = url
-        return info
-
-    def _extract_topics(self, soup: BeautifulSoup, offset: int, page_url: str) -> Iterable[Dict]:
-        rows = soup.select("div#messageindex table.table_grid tbody tr")
+        return BoardInfoItem(
+            board_id=self.board_id,
+            name=title,
+            description=description,
+            topics=None,
+            posts=posts,
+            url=url,
+        )
+
+    def _extract_topics(
+        self, root, offset: int, page_url: str
+    ) -> Iterable[Dict]:
+        rows = _SEL_TOPIC_ROWS(root)
         for row in rows:
-            subject_link = row.select_one("td.subject span[id^='msg_'] > a")
-            if not subject_link:
+            subject_link = first(_SEL_TOPIC_SUBJECT, row)
+            if subject_link is None:
                 continue
             topic_url = subject_link.get("href")
             topic_id = parse_topic_id(topic_url)
             if not topic_id:
                 continue
-            starter_el = row.select_one("td.subject p a[href*='profile;u=']")
-            stats_el = row.select_one("td.stats")
-            stats_text = stats_el.get_text(" ", strip=True) if stats_el else ""
+            starter_el = first(_SEL_TOPIC_STARTER, row)
+            stats_el = first(_SEL_TOPIC_STATS, row)
+            stats_text = text_content(stats_el, " ") if stats_el is not None else ""
             numbers = [
                 int(num.replace(",", ""))
-                for num in re.findall(r"\d[\d,]*", stats_text)
+                for num in _COUNT_RE.findall(stats_text)
             ]
             replies = numbers[0] if numbers else None
             views = numbers[1] if len(numbers) > 1 else None
-            last_post_cell = row.select_one("td.lastpost")
+            last_post_cell = first(_SEL_TOPIC_LAST_POST, row)
             last_author = None
             last_time = None
             last_link = None
-            if last_post_cell:
-                profile_link = last_post_cell.select_one("a[href*='profile;u=']")
-                if profile_link:
-                    last_author = profile_link.get_text(strip=True)
-                last_anchor = last_post_cell.select_one("a[href*='topic=']")
-                if last_anchor:
-                    last_link = last_anchor.get("href")
-                time_el = last_post_cell.find("strong")
-                if time_el:
-                    parts = [time_el.get_text(strip=True)]
-                    sibling = time_el.next_sibling
-                    while sibling:
-                        if getattr(sibling, "name", None) == "br":
-                            break
-                        text = sibling.strip() if isinstance(sibling, str) else sibling.get_text(strip=True)
-                        if text:
-                            parts.append(text)
-                        sibling = sibling.next_sibling
-                    last_time = normalize_space(" ".join(parts))
+            if last_post_cell is not None:
+                # One pass over the cell's anchors picks up both links.
+                for anchor in last_post_cell.iter("a"):
+                    href = anchor.get("href")
+                    if not href:
+                        continue
+                    if last_author is None and "profile;u=" in href:
+                        last_author = self._intern(text_content(anchor, ""))
+                    elif last_link is None and "topic=" in href:
+                        last_link = href
+                    if last_author is not None and last_link is not None:
+                        break
+                last_time = normalize_space(" ".join(_LAST_POST_TIME_TEXT(last_post_cell)))
                 if not last_time:
-                    last_time = normalize_space(last_post_cell.get_text(" ", strip=True))
+                    last_time = normalize_space(text_content(last_post_cell, " "))
             yield {
                 "board_id": self.board_id,
                 "board_offset": offset,
                 "topic_id": topic_id,
-                "subject": subject_link.get_text(strip=True),
-                "starter": starter_el.get_text(strip=True) if starter_el else "",
+                "subject": text_content(subject_link, ""),
+                "starter": self._intern(text_content(starter_el, "")) if starter_el is not None else "",
                 "replies": replies,
                 "views": views,
                 "last_post_author": last_author,
@@ -585,8 +809,24 @@ class TechTalkSpider(scrapy.Spider):
                 "page_url": page_url,
             }
 
-    def _schedule_topic(self, topic_id: str, url: str, offset: int):
-        yield scrapy.Request(
+    def _topic_unchanged(self, topic_id: str, version: Optional[int]) -> bool:
+        # Under JOBDIR the reply count each topic was last fully fetched at is
+        # kept in the persisted spider state, so later runs skip topics without
+        # new posts instead of spending max_topics on them.
+        state = getattr(self, "state", None)
+        if state is None or version is None:
+            return False
+        return state.get("topic_versions", {}).get(topic_id) == version
+
+    def _record_topic_version(self, topic_id: str, version: Optional[int]) -> None:
+        state = getattr(self, "state", None)
+        if state is not None and version is not None:
+            state.setdefault("topic_versions", {})[topic_id] = version
+
+    def _schedule_topic(
+        self, topic_id: str, url: str, offset: int, version: Optional[int] = None
+    ) -> scrapy.Request:
+        return scrapy.Request(
             url,
             callback=self.parse_topic,
             meta=self._build_meta(
@@ -594,36 +834,61 @@ class TechTalkSpider(scrapy.Spider):
                     "board_id": self.board_id,
                     "topic_id": topic_id,
                     "topic_offset": offset,
+                    "topic_version": version,
                     "cf_retry": 0,
                 }
             ),
         )
 
-    def parse_topic(self, response: scrapy.http.Response):
+    async def parse_topic(self, response: scrapy.http.Response):
         if response.status in (403, 520):
             retry_request = self._retry_with_new_context(response)
             if retry_request:
                 yield retry_request
             return
+        self._mark_context_cleared(response)
         topic_id = response.meta["topic_id"]
         board_id = response.meta["board_id"]
         offset = response.meta.get("topic_offset", 0)
-        soup = BeautifulSoup(response.text, "html.parser")
-        posts = self._extract_posts(soup, board_id, topic_id, offset, response.url)
+        root = await self._parsed_root(response)
+        posts = list(self._extract_posts(root, board_id, topic_id, offset, response.url))
+        if self.deep_clean:
+            # trafilatura is CPU-bound; keep it off the reactor thread.
+            extracted = await asyncio.get_running_loop().run_in_executor(
+                _get_executor(),
+                extract_post_texts,
+                [post["content_html"] for post in posts],
+            )
+            for post, extracted_text in zip(posts, extracted):
+                if extracted_text:
+                    post["extracted_text"] = extracted_text
+        if posts:
+            # Raw HTML dwarfs the extracted text; items only carry a reference
+            # to the sidecar file, so feeds and pipelines never see it.
+            await asyncio.get_running_loop().run_in_executor(
+                None,
+                store_post_html,
+                Path(self.data_dir or project_settings.DATA_DIR),
+                board_id,
+                topic_id,
+                posts,
+            )
         for post in posts:
             yield PostItem(**post)
 
+        version = response.meta.get("topic_version")
         pages_seen = response.meta.get("pages_seen", 0) + 1
         if self.topic_max_pages and pages_seen >= self.topic_max_pages:
+            self._record_topic_version(topic_id, version)
             return
 
-        offsets = collect_offsets(soup, "topic", topic_id)
+        offsets = collect_offsets(root, "topic", topic_id)
         next_off = next_offset(offsets, offset)
         if next_off is None:
+            self._record_topic_version(topic_id, version)
             return
 
-        params = {"topic": f"{topic_id}.{next_off}"}
-        next_url = f"https://forums.dansdeals.com/index.php?{urlencode(params)}"
+        next_url = f"https://forums.dansdeals.com/index.php?topic={topic_id}.{next_off}"
         yield scrapy.Request(
             next_url,
             callback=self.parse_topic,
@@ -632,6 +897,7 @@ class TechTalkSpider(scrapy.Spider):
                     "board_id": board_id,
                     "topic_id": topic_id,
                     "topic_offset": next_off,
+                    "topic_version": version,
                     "pages_seen": pages_seen,
                     "cf_retry": 0,
                 }
@@ -640,67 +906,59 @@ class TechTalkSpider(scrapy.Spider):
 
     def _extract_posts(
         self,
-        soup: BeautifulSoup,
+        root,
         board_id: str,
         topic_id: str,
         offset: int,
         page_url: str,
     ):
-        wrappers = soup.select("div#forumposts div.post_wrapper")
+        wrappers = _SEL_POST_WRAPPERS(root)
         for idx, wrapper in enumerate(wrappers):
-            content_div = wrapper.select_one("div.post div.inner")
-            if not content_div:
+            content_div = first(_SEL_POST_CONTENT, wrapper)
+            if content_div is None:
                 continue
             post_id_attr = content_div.get("id", "")
-            if not post_id_attr.startswith("msg_"):
+            if post_id_attr[:4] != "msg_":
                 continue
-            post_id = post_id_attr.replace("msg_", "")
-            poster_link = wrapper.select_one("div.poster h4 a")
-            author_name = poster_link.get_text(strip=True) if poster_link else ""
-            author_profile = poster_link.get("href") if poster_link else None
+            post_id = post_id_attr[4:]
+            poster_link = first(_SEL_POSTER_LINK, wrapper)
+            author_name = self._intern(text_content(poster_link, "")) if poster_link is not None else ""
+            author_profile = self._intern(poster_link.get("href")) if poster_link is not None else None
             author_title = None
             author_details = []
-            extra_info = wrapper.select_one(f"ul#msg_{post_id}_extra_info")
-            if extra_info:
-                for li in extra_info.select("li"):
-                    text = li.get_text(" ", strip=True)
+            extra_info = first(_SEL_EXTRA_INFO, wrapper)
+            if extra_info is not None:
+                for li in _SEL_LIST_ITEMS(extra_info):
+                    text = text_content(li, " ")
                     if text:
-                        author_details.append(text)
-                title_el = extra_info.select_one("li.membergroup")
-                if title_el:
-                    author_title = normalize_space(title_el.get_text(" ", strip=True))
-            subject_el = wrapper.select_one(f"h5#subject_{post_id} a")
-            subject = subject_el.get_text(strip=True) if subject_el else None
-            permalink = subject_el.get("href") if subject_el else None
-            time_el = wrapper.select_one("div.keyinfo div.smalltext")
-            posted_at = normalize_space(time_el.get_text(" ", strip=True)) if time_el else None
-            content_html = content_div.decode_contents()
-            content_text = content_div.get_text("\n", strip=True)
-            extracted_text = trafilatura.extract(
-                f"<html><body>{content_html}</body></html>",
-                include_comments=False,
-                include_tables=False,
-                favor_precision=True,
-            )
-            if not extracted_text:
-                extracted_text = normalize_space(content_text)
-            signature_div = wrapper.select_one("div.signature")
-            signature_html = signature_div.decode_contents().strip() if signature_div else None
-            signature_text = signature_div.get_text(" ", strip=True) if signature_div else None
-            edited_div = wrapper.select_one("div.moderatorbar div.modified")
-            edited = normalize_space(edited_div.get_text(" ", strip=True)) if edited_div else None
-            likes_span = wrapper.select_one("div.like_post_box span")
-            likes = parse_int(likes_span.get_text(strip=True)) if likes_span else None
+                        author_details.append(self._intern(text))
+                title_el = first(_SEL_MEMBER_GROUP, extra_info)
+                if title_el is not None:
+                    author_title = self._intern(normalize_space(text_content(title_el, " ")))
+            subject_el = first(_SEL_POST_SUBJECT, wrapper)
+            subject = text_content(subject_el, "") if subject_el is not None else None
+            permalink = subject_el.get("href") if subject_el is not None else None
+            time_el = first(_SEL_POST_TIME, wrapper)
+            posted_at = normalize_space(text_content(time_el, " ")) if time_el is not None else None
+            content_html = inner_html(content_div)
+            content_text = text_content(content_div)
+            signature_div = first(_SEL_SIGNATURE, wrapper)
+            signature_html = inner_html(signature_div).strip() if signature_div is not None else None
+            signature_text = text_content(signature_div, " ") if signature_div is not None else None
+            edited_div = first(_SEL_EDITED, wrapper)
+            edited = normalize_space(text_content(edited_div, " ")) if edited_div is not None else None
+            likes_span = first(_SEL_LIKES, wrapper)
+            likes = parse_int(text_content(likes_span, "")) if likes_span is not None else None
             attachments = []
-            for attach in wrapper.select("div.attachments li"):
-                link = attach.find("a")
-                if not link:
+            for attach in _SEL_ATTACHMENTS(wrapper):
+                link = attach.find(".//a")
+                if link is None:
                     continue
                 attachments.append(
                     {
-                        "name": link.get_text(strip=True),
+                        "name": text_content(link, ""),
                         "url": link.get("href"),
-                        "details": normalize_space(attach.get_text(" ", strip=True)),
+                        "details": normalize_space(text_content(attach, " ")),
                     }
                 )
             yield {
@@ -717,7 +975,7 @@ class TechTalkSpider(scrapy.Spider):
                 "permalink": permalink,
                 "content_html": content_html,
                 "content_text": content_text,
-                "extracted_text": extracted_text,
+                "extracted_text": normalize_space(content_text),
                 "signature_html": signature_html,
                 "signature_text": signature_text,
                 "edited": edited,
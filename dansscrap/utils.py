@@ -1,28 +1,127 @@
+import html
+import queue
 import re
-from typing import Dict, List, Optional, Set, Tuple
-from urllib.parse import parse_qs, urlparse
+from bisect import bisect_right
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Sequence, Set, Tuple
 
-from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
+from lxml.cssselect import CSSSelector
+
+
+_VOLATILE_URL_PARTS = re.compile(r"PHPSESSID=[^&;#]*[&;]?|;topicseen\b")
+# Whitespace stays Unicode-aware so &nbsp; (U+00A0) still collapses; counts
+# and offsets are plain ASCII digits.
+_WHITESPACE_RE = re.compile(r"\s+")
+_DIGITS_RE = re.compile(r"\d+", re.ASCII)
+# Pagination only needs the hrefs, so select the attribute strings directly
+# instead of materialising an element proxy per link.
+_PAGE_LINK_HREFS = etree.XPath(CSSSelector("div.pagelinks a.navPages").path + "/@href")
+_DESCENDANT_TEXT = etree.XPath(".//text()")
+
+
+# lxml parsers are reusable but not thread-safe, so each caller borrows one.
+_PARSER_POOL: "queue.LifoQueue[lxml_html.HTMLParser]" = queue.LifoQueue()
+
+
+@contextmanager
+def pooled_html_parser() -> Iterator[lxml_html.HTMLParser]:
+    try:
+        parser = _PARSER_POOL.get_nowait()
+    except queue.Empty:
+        parser = lxml_html.HTMLParser(recover=True, remove_blank_text=True)
+    try:
+        yield parser
+    finally:
+        _PARSER_POOL.put(parser)
+
+
+def html_fragment_tree(fragment: str) -> lxml_html.HtmlElement:
+    """Parse a post body fragment into a full document tree with a pooled parser."""
+    with pooled_html_parser() as parser:
+        return lxml_html.document_fromstring(f"<html><body>{fragment}</body></html>", parser=parser)
+
+
+def first(selector: CSSSelector, element):
+    """Return the first match of a compiled selector under ``element``, or ``None``."""
+    matches = selector(element)
+    return matches[0] if matches else None
+
+
+def inner_html(element) -> str:
+    """Serialise the children of ``element``, like BeautifulSoup's ``decode_contents()``."""
+    if not len(element):
+        return html.escape(element.text, quote=False) if element.text else ""
+    # Serialise the subtree in one call and cut off the element's own tags,
+    # whose exact form comes from serialising an empty copy of it.
+    full = etree.tostring(element, encoding="unicode", method="html", with_tail=False)
+    shell = etree.tostring(
+        etree.Element(element.tag, element.attrib), encoding="unicode", method="html"
+    )
+    close_len = len(f"</{element.tag}>")
+    return full[len(shell) - close_len : len(full) - close_len]
+
+
+def text_content(element, separator: str = "\n") -> str:
+    """Join stripped descendant text nodes, like BeautifulSoup's ``get_text(sep, strip=True)``."""
+    return separator.join(text for text in (node.strip() for node in _DESCENDANT_TEXT(element)) if text)
 
 
 def normalize_space(value: str) -> str:
-    return re.sub(r"\s+", " ", value).strip()
+    return _WHITESPACE_RE.sub(" ", value).strip()
 
 
 def parse_int(value: Optional[str]) -> Optional[int]:
     if not value:
         return None
-    digits = re.findall(r"\d+", value.replace(",", ""))
-    return int("".join(digits)) if digits else None
+    value = value.replace(",", "").strip()
+    # Most inputs are already clean counts; skip the regex for those.
+    # isdecimal() rather than isdigit() so superscripts never reach int().
+    if value.isdecimal():
+        return int(value)
+    # Fold the digit runs into one number without joining them into a string.
+    total = None
+    for match in _DIGITS_RE.finditer(value):
+        run = match.group()
+        total = (total or 0) * 10 ** len(run) + int(run)
+    return total
+
+
+def _qs_get(url: str, key: str) -> str:
+    """Return the first raw value of ``key`` in ``url``'s query string, or ``""``.
+
+    Forum ids and offsets are never percent-encoded, so a plain scan is enough
+    and avoids building a ``ParseResult`` and a dict of lists per URL.
+    """
+    start = url.find("?")
+    if start < 0:
+        return ""
+    query = url[start + 1 :].split("#", 1)[0]
+    prefix = key + "="
+    for part in query.split("&"):
+        if part.startswith(prefix):
+            return part[len(prefix) :]
+    return ""
+
+
+def _leading_id(url: str, key: str) -> Optional[str]:
+    """Fast path for the usual ``index.php?<key>=<digits>.<offset>`` shape."""
+    start = url.find(f"?{key}=")
+    if start < 0:
+        return None
+    start += len(key) + 2
+    end = url.find(".", start)
+    candidate = url[start:end]
+    return candidate if end > start and candidate.isdigit() else None
 
 
 def parse_board_id(url: str) -> Optional[str]:
-    parsed = urlparse(url)
-    qs = parse_qs(parsed.query)
-    if "board" in qs:
-        value = qs["board"][0]
-    else:
-        value = ""
+    fast = _leading_id(url, "board")
+    if fast is not None:
+        return fast
+    value = _qs_get(url, "board")
     if not value and "board=" in url:
         value = url.rsplit("board=", 1)[-1]
     value = value.split(";", 1)[0]
@@ -31,46 +130,74 @@ def parse_board_id(url: str) -> Optional[str]:
 
 
 def parse_topic_id(url: str) -> Optional[str]:
-    parsed = urlparse(url)
-    qs = parse_qs(parsed.query)
-    if "topic" not in qs:
+    fast = _leading_id(url, "topic")
+    if fast is not None:
+        return fast
+    value = _qs_get(url, "topic")
+    if not value:
         return None
-    value = qs["topic"][0].split(";", 1)[0]
-    return value.split(".", 1)[0]
+    return value.split(";", 1)[0].split(".", 1)[0]
+
+
+ABORTED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+TRACKER_HOSTS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "googlesyndication.com",
+    "doubleclick.net",
+    "facebook.net",
+    "hotjar.com",
+    "quantserve.com",
+    "scorecardresearch.com",
+)
+
+
+def should_abort_request(request) -> bool:
+    """``PLAYWRIGHT_ABORT_REQUEST`` predicate: skip assets and trackers no extractor reads.
 
+    Stylesheets are still loaded because the Cloudflare widget needs its layout.
+    """
+    if request.resource_type in ABORTED_RESOURCE_TYPES:
+        return True
+    url = request.url
+    return any(host in url for host in TRACKER_HOSTS)
 
-def collect_offsets(soup: BeautifulSoup, param: str, ident: str) -> Set[int]:
+
+def canonical_forum_url(url: str) -> str:
+    """Strip session ids, ``;topicseen`` markers and fragments from a forum URL."""
+    url = url.split("#", 1)[0]
+    return _VOLATILE_URL_PARTS.sub("", url).rstrip("?&;")
+
+
+def collect_offsets(root, param: str, ident: str) -> List[int]:
+    """Return the sorted ``param=<ident>.<offset>`` offsets linked from the page's pagelinks.
+
+    ``root`` is the lxml tree Scrapy already built for the response
+    (``response.selector.root``), so the page is never parsed a second time.
+    """
     offsets: Set[int] = set()
-    for link in soup.select("div.pagelinks a.navPages"):
-        href = link.get("href")
-        if not href:
-            continue
-        parsed = urlparse(href)
-        query = parse_qs(parsed.query)
-        if param not in query:
-            continue
-        entry = query[param][0].split(";", 1)[0]
-        if "." not in entry:
-            continue
-        current_ident, offset = entry.split(".", 1)
-        if current_ident != ident:
-            continue
-        offset = offset.split("#", 1)[0]
-        match = re.match(r"(\d+)", offset)
-        if match:
-            offsets.add(int(match.group(1)))
+    pattern = _offset_pattern(param)
+    for href in _PAGE_LINK_HREFS(root):
+        match = pattern.search(href)
+        if match and match.group(1) == ident:
+            offsets.add(int(match.group(2)))
     offsets.add(0)
-    return offsets
+    return sorted(offsets)
+
+
+@lru_cache(maxsize=None)
+def _offset_pattern(param: str) -> "re.Pattern[str]":
+    """``param=<ident>.<offset>`` in a query string, as ``(ident, offset)`` groups."""
+    return re.compile(rf"[?&]{re.escape(param)}=([^.;&#]+)\.(\d+)", re.ASCII)
 
 
-def detect_step(offsets: Set[int], default: int) -> int:
-    ordered = sorted(offsets)
-    diffs = [b - a for a, b in zip(ordered, ordered[1:]) if b > a]
-    positives = [d for d in diffs if d > 0]
-    return min(positives) if positives else default
+def detect_step(offsets: Sequence[int], default: int) -> int:
+    """Smallest gap between the sorted, distinct ``offsets``, or ``default``."""
+    return min((b - a for a, b in zip(offsets, offsets[1:])), default=default)
 
 
-def next_offset(offsets: Set[int], current: int) -> Optional[int]:
-    candidates = [value for value in offsets if value > current]
-    return min(candidates) if candidates else None
+def next_offset(offsets: Sequence[int], current: int) -> Optional[int]:
+    """First offset after ``current`` in the sorted ``offsets``."""
+    index = bisect_right(offsets, current)
+    return offsets[index] if index < len(offsets) else None
 